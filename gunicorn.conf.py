@@ -0,0 +1,8 @@
+# Gunicorn settings, loaded automatically from the working directory
+
+def post_worker_init(worker):
+    # Warm up after the fork so every worker opens its own Twilio and Sheets
+    # connections, with or without --preload
+    import main
+    if main.PRELOAD_CLIENTS:
+        main.warmup()
@@ -3,14 +3,18 @@
 # This is the FULL, COMPLETE, TESTED version
 
 import os
+import time
+# Must stay above the flask import so import_seconds includes it
+_BOOT_STARTED = time.perf_counter()
+
 from flask import Flask, render_template_string, request, jsonify, Response
 from flask_cors import CORS
-from twilio.rest import Client
-from twilio.twiml.voice_response import VoiceResponse, Gather
-import gspread
-from google.oauth2.service_account import Credentials
 from datetime import datetime
+from collections import Counter
 import json
+import re
+import threading
+from urllib.parse import quote
 
 app = Flask(__name__)
 CORS(app)
@@ -21,18 +25,109 @@ TWILIO_AUTH_TOKEN = os.environ.get('TWILIO_AUTH_TOKEN', '')
 TWILIO_PHONE_NUMBER = os.environ.get('TWILIO_PHONE_NUMBER', '')
 GOOGLE_SHEETS_CREDS = os.environ.get('GOOGLE_SHEETS_CREDS', '')
 SPREADSHEET_ID = os.environ.get('SPREADSHEET_ID', '')
+# Authenticate clients and prime the roster cache in each gunicorn worker
+# before it serves traffic (see warmup() and gunicorn.conf.py). Warmup gives up
+# waiting after WARMUP_TIMEOUT_SECONDS, keep it below gunicorn's --timeout.
+PRELOAD_CLIENTS = os.environ.get('PRELOAD_CLIENTS', '').lower() in ('1', 'true', 'yes')
+WARMUP_TIMEOUT_SECONDS = float(os.environ.get('WARMUP_TIMEOUT_SECONDS', 20))
+CLIENT_TIMEOUT_SECONDS = float(os.environ.get('CLIENT_TIMEOUT_SECONDS', 10))
+CLIENT_RETRY_SECONDS = float(os.environ.get('CLIENT_RETRY_SECONDS', 5))
+CLIENT_RETRY_MAX_SECONDS = float(os.environ.get('CLIENT_RETRY_MAX_SECONDS', 300))
+ROSTER_CACHE_SECONDS = float(os.environ.get('ROSTER_CACHE_SECONDS', 60))
+ROLLUP_REFRESH_SECONDS = float(os.environ.get('ROLLUP_REFRESH_SECONDS', 300))
 
-# Initialize Twilio
-try:
-    if TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN:
-        twilio_client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
-        print("Twilio initialized successfully")
-    else:
-        twilio_client = None
-        print("Twilio not configured")
-except Exception as e:
-    print(f"Twilio error: {e}")
-    twilio_client = None
+# Seconds spent in each startup phase, exposed on /healthz and /readyz
+startup_timings = {}
+
+# ============= LAZY CLIENTS =============
+# Twilio and Sheets clients are built on first use. A failed init is retried
+# on a later call after an exponential backoff instead of being given up on.
+class LazyClient:
+    def __init__(self, name, factory):
+        self.name = name
+        self.factory = factory
+        self.client = None
+        self.last_error = None
+        self.failures = 0
+        self.retry_at = 0
+        self.lock = threading.Lock()
+        self.pid = os.getpid()
+
+    def get(self):
+        if self.pid != os.getpid():
+            # Forked after init: never share the parent's connections
+            self.lock = threading.Lock()
+            self.client = None
+            self.retry_at = 0
+            self.pid = os.getpid()
+        if self.client is not None:
+            return self.client
+        with self.lock:
+            if self.client is not None:
+                return self.client
+            if time.monotonic() < self.retry_at:
+                return None
+            started = time.perf_counter()
+            try:
+                self.client = self.factory()
+                self.last_error = None
+                self.failures = 0
+                startup_timings.setdefault(f'{self.name}_init_seconds', round(time.perf_counter() - started, 3))
+                print(f"{self.name} initialized successfully")
+            except Exception as e:
+                self.failures += 1
+                self.last_error = str(e)
+                delay = min(CLIENT_RETRY_SECONDS * 2 ** (self.failures - 1), CLIENT_RETRY_MAX_SECONDS)
+                self.retry_at = time.monotonic() + delay
+                print(f"{self.name} error: {e} (retrying in {delay:.0f}s)")
+            return self.client
+
+    def status(self):
+        return {
+            'initialized': self.client is not None,
+            'failures': self.failures,
+            'last_error': self.last_error
+        }
+
+def _create_twilio_client():
+    if not (TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN):
+        raise RuntimeError('Twilio not configured')
+    from twilio.rest import Client
+    from twilio.http.http_client import TwilioHttpClient
+    client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN,
+                    http_client=TwilioHttpClient(timeout=CLIENT_TIMEOUT_SECONDS))
+    # Client() makes no request; fetch the account so bad credentials fail here
+    client.api.accounts(TWILIO_ACCOUNT_SID).fetch()
+    return client
+
+def _create_spreadsheet():
+    if not GOOGLE_SHEETS_CREDS or not SPREADSHEET_ID:
+        raise RuntimeError('Missing Google credentials')
+    import gspread
+    from google.oauth2.service_account import Credentials
+    creds_dict = json.loads(GOOGLE_SHEETS_CREDS)
+    creds = Credentials.from_service_account_info(
+        creds_dict,
+        scopes=['https://www.googleapis.com/auth/spreadsheets']
+    )
+    client = gspread.authorize(creds)
+    client.set_timeout(CLIENT_TIMEOUT_SECONDS)
+    return client.open_by_key(SPREADSHEET_ID)
+
+twilio_lazy = LazyClient('twilio', _create_twilio_client)
+sheets_lazy = LazyClient('sheets', _create_spreadsheet)
+
+def get_twilio_client():
+    """Get the Twilio client, initializing it on first use"""
+    if not (TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN):
+        return None
+    return twilio_lazy.get()
+
+def twilio_error():
+    """Why get_twilio_client() returned None"""
+    if not (TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN):
+        return 'Twilio not configured'
+    return f'Twilio unavailable, retrying: {twilio_lazy.last_error}'
 
 # ============= GOOGLE SHEETS CONNECTION =============
 def get_google_sheet():
@@ -42,13 +137,9 @@ def get_google_sheet():
             print("Missing Google credentials")
             return None
             
-        creds_dict = json.loads(GOOGLE_SHEETS_CREDS)
-        creds = Credentials.from_service_account_info(
-            creds_dict,
-            scopes=['https://www.googleapis.com/auth/spreadsheets']
-        )
-        client = gspread.authorize(creds)
-        sheet = client.open_by_key(SPREADSHEET_ID)
+        sheet = sheets_lazy.get()
+        if not sheet:
+            return None
         return sheet.worksheet('Students')
     except Exception as e:
         print(f"Google Sheets error: {e}")
@@ -60,13 +151,9 @@ def get_call_log_sheet():
         if not GOOGLE_SHEETS_CREDS or not SPREADSHEET_ID:
             return None
             
-        creds_dict = json.loads(GOOGLE_SHEETS_CREDS)
-        creds = Credentials.from_service_account_info(
-            creds_dict,
-            scopes=['https://www.googleapis.com/auth/spreadsheets']
-        )
-        client = gspread.authorize(creds)
-        sheet = client.open_by_key(SPREADSHEET_ID)
+        sheet = sheets_lazy.get()
+        if not sheet:
+            return None
         
         try:
             return sheet.worksheet('CallLogs')
@@ -79,6 +166,137 @@ def get_call_log_sheet():
         print(f"CallLogs error: {e}")
         return None
 
+_roster_cache = {'records': None, 'loaded_at': 0}
+_roster_lock = threading.Lock()
+
+def get_roster():
+    """Get Students records, cached for ROSTER_CACHE_SECONDS"""
+    with _roster_lock:
+        if _roster_cache['records'] is not None and time.monotonic() - _roster_cache['loaded_at'] < ROSTER_CACHE_SECONDS:
+            return _roster_cache['records']
+        worksheet = get_google_sheet()
+        if not worksheet:
+            return None
+        _roster_cache['records'] = worksheet.get_all_records()
+        _roster_cache['loaded_at'] = time.monotonic()
+        return _roster_cache['records']
+
+def invalidate_roster():
+    """Drop the cached roster so the next load reads the sheet"""
+    with _roster_lock:
+        _roster_cache['records'] = None
+
+def check_student_row(student_row, expected_name):
+    """Error message if the sheet row no longer holds the student the dashboard showed"""
+    # The dashboard addresses students by position in a possibly cached roster
+    if expected_name is None or str(student_row[2]).strip() == str(expected_name).strip():
+        return None
+    invalidate_roster()
+    return 'Student list has changed, click Load Students and try again'
+
+# ============= REPORT ROLLUPS =============
+# Aggregates over CallLogs so reports don't rescan the sheet per request.
+# Each process builds them from CallLogs on first use, then rebuilds them in a
+# background thread once they are older than ROLLUP_REFRESH_SECONDS, serving
+# the old counters meanwhile. Its own log_call / log_permission_response
+# writes are applied in between, so writes handled by other workers (and hand
+# edits) show up after the next rebuild. Each counter holds: calls, late,
+# permission, father, mother, Granted, Denied.
+def _empty_rollups(rows=0):
+    # rows: last CallLogs sheet row in the rebuild's snapshot, so log_call
+    #   doesn't add a row the snapshot already counted
+    # responses: sheet row -> response counted for that permission call, so
+    #   repeated or racing IVR responses move the count instead of adding to it
+    return {'totals': Counter(), 'days': {}, 'students': {}, 'rows': rows, 'responses': {}}
+
+_rollups = None
+_rollups_loaded_at = 0
+_rollups_failures = 0
+_rollups_retry_at = 0
+# Guards the counters only; never held across a Sheets call
+_rollups_lock = threading.Lock()
+# Held by whichever thread is rebuilding
+_rollups_refresh_lock = threading.Lock()
+
+def _rollup_counters(rollups, timestamp, student_name):
+    day = timestamp[:10]
+    month = timestamp[:7]
+    day_counts = rollups['days'].setdefault(day, Counter())
+    student_counts = rollups['students'].setdefault(month, {}).setdefault(student_name, Counter())
+    return rollups['totals'], day_counts, student_counts
+
+def _rollup_call(rollups, timestamp, student_name, call_type, target):
+    """Add one logged call to the rollups (caller holds the lock)"""
+    for counts in _rollup_counters(rollups, timestamp, student_name):
+        counts['calls'] += 1
+        counts[call_type] += 1
+        counts[target] += 1
+
+def _rollup_response(rollups, sheet_row, timestamp, student_name, response):
+    """Move a permission call to its new response (caller holds the lock)"""
+    old_response = rollups['responses'].get(sheet_row, '')
+    if old_response == response:
+        return
+    for counts in _rollup_counters(rollups, timestamp, student_name):
+        if old_response:
+            counts[old_response] -= 1
+        counts[response] += 1
+    rollups['responses'][sheet_row] = response
+
+def _rebuild_rollups():
+    """Rebuild rollups from CallLogs; on failure keep the old ones and back off"""
+    global _rollups, _rollups_loaded_at, _rollups_failures, _rollups_retry_at
+    try:
+        worksheet = get_call_log_sheet()
+        if not worksheet:
+            raise RuntimeError('Cannot connect to sheets')
+        values = worksheet.get_all_values()
+        fresh = _empty_rollups(len(values))
+        for sheet_row, row in enumerate(values[1:], start=2):
+            if len(row) < 4 or not row[0]:
+                continue
+            _rollup_call(fresh, row[0], row[1], row[2], row[3])
+            if len(row) > 6 and row[6]:
+                _rollup_response(fresh, sheet_row, row[0], row[1], row[6])
+        with _rollups_lock:
+            _rollups = fresh
+            _rollups_loaded_at = time.monotonic()
+        _rollups_failures = 0
+    except Exception as e:
+        _rollups_failures += 1
+        delay = min(CLIENT_RETRY_SECONDS * 2 ** (_rollups_failures - 1), CLIENT_RETRY_MAX_SECONDS)
+        _rollups_retry_at = time.monotonic() + delay
+        print(f"Rollups error: {e} (retrying in {delay:.0f}s)")
+
+def _rebuild_rollups_in_background():
+    try:
+        _rebuild_rollups()
+    finally:
+        _rollups_refresh_lock.release()
+
+def refresh_rollups():
+    """Make sure rollups exist; only the first build blocks the caller"""
+    now = time.monotonic()
+    if now < _rollups_retry_at:
+        return _rollups is not None
+    if _rollups is None:
+        with _rollups_refresh_lock:
+            if _rollups is None:
+                _rebuild_rollups()
+    elif now - _rollups_loaded_at >= ROLLUP_REFRESH_SECONDS and _rollups_refresh_lock.acquire(blocking=False):
+        threading.Thread(target=_rebuild_rollups_in_background, daemon=True).start()
+    return _rollups is not None
+
+def _appended_row(result):
+    """Sheet row written by append_row, or 0 if the API didn't say"""
+    updated_range = (result or {}).get('updates', {}).get('updatedRange', '')
+    match = re.search(r'![A-Z]+(\d+)', updated_range)
+    return int(match.group(1)) if match else 0
+
+def _grant_rate(counts):
+    answered = counts['Granted'] + counts['Denied']
+    return round(counts['Granted'] / answered, 3) if answered else None
+
 # ============= MAIN PAGE =============
 @app.route('/')
 def index():
@@ -222,6 +440,7 @@ def index():
             <button onclick="checkStatus()">Check Status</button>
             <button onclick="testDebug()">Debug Info</button>
             <button onclick="viewLogs()">View Logs</button>
+            <button onclick="viewReports()">Reports</button>
         </div>
         
         <div id="statusMessage" class="status"></div>
@@ -345,6 +564,7 @@ def index():
                 headers: {'Content-Type': 'application/json'},
                 body: JSON.stringify({
                     row_index: index + 2,
+                    student_name: name,
                     target: target
                 })
             })
@@ -368,6 +588,10 @@ def index():
         function viewLogs() {
             window.location.href = '/logs';
         }
+        
+        function viewReports() {
+            window.location.href = '/reports';
+        }
     </script>
 </body>
 </html>
@@ -383,15 +607,33 @@ def api_status():
         'sheets_configured': bool(GOOGLE_SHEETS_CREDS and SPREADSHEET_ID)
     })
 
+@app.route('/healthz')
+def healthz():
+    """Liveness: the process is up and serving requests"""
+    return jsonify({'status': 'ok', 'startup': startup_timings})
+
+@app.route('/readyz')
+def readyz():
+    """Readiness: every configured client is initialized"""
+    checks = {}
+    if TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN:
+        get_twilio_client()
+        checks['twilio'] = twilio_lazy.status()
+    if GOOGLE_SHEETS_CREDS and SPREADSHEET_ID:
+        sheets_lazy.get()
+        checks['sheets'] = sheets_lazy.status()
+    ready = all(check['initialized'] for check in checks.values())
+    body = {'ready': ready, 'checks': checks, 'startup': startup_timings}
+    return jsonify(body), 200 if ready else 503
+
 @app.route('/api/students')
 def get_students():
     """Get all students from Google Sheets"""
     try:
-        worksheet = get_google_sheet()
-        if not worksheet:
+        records = get_roster()
+        if records is None:
             return jsonify({'error': 'Cannot connect to Google Sheets', 'students': []})
         
-        records = worksheet.get_all_records()
         return jsonify({'students': records})
     except Exception as e:
         return jsonify({'error': str(e), 'students': []})
@@ -433,8 +675,9 @@ def debug():
 def make_late_call():
     """Initiate late attendance call"""
     try:
+        twilio_client = get_twilio_client()
         if not twilio_client:
-            return jsonify({'success': False, 'error': 'Twilio not configured'})
+            return jsonify({'success': False, 'error': twilio_error()})
             
         data = request.json
         row_index = data.get('row_index', 2)
@@ -449,6 +692,10 @@ def make_late_call():
         if len(student_row) < 8:
             return jsonify({'success': False, 'error': 'Invalid student data'})
         
+        error = check_student_row(student_row, data.get('student_name'))
+        if error:
+            return jsonify({'success': False, 'error': error})
+        
         student_name = student_row[2]
         gender = student_row[3]
         parent_name = student_row[4] if target == 'father' else student_row[5]
@@ -486,8 +733,9 @@ def make_late_call():
 def make_permission_call():
     """Initiate permission request call"""
     try:
+        twilio_client = get_twilio_client()
         if not twilio_client:
-            return jsonify({'success': False, 'error': 'Twilio not configured'})
+            return jsonify({'success': False, 'error': twilio_error()})
             
         data = request.json
         row_index = data.get('row_index', 2)
@@ -502,6 +750,10 @@ def make_permission_call():
         if len(student_row) < 8:
             return jsonify({'success': False, 'error': 'Invalid student data'})
         
+        error = check_student_row(student_row, data.get('student_name'))
+        if error:
+            return jsonify({'success': False, 'error': error})
+        
         phone = student_row[6] if target == 'father' else student_row[7]
         
         if not phone:
@@ -512,8 +764,10 @@ def make_permission_call():
         if not phone.startswith('+'):
             phone = '+91' + phone[-10:]
         
-        # Generate TwiML URL
-        twiml_url = request.url_root + f'twiml/permission/{row_index}/{target}'
+        student_name = student_row[2]
+        
+        # Generate TwiML URL; the name lets the callbacks spot a moved row
+        twiml_url = request.url_root + f'twiml/permission/{row_index}/{target}?student={quote(student_name)}'
         
         call = twilio_client.calls.create(
             to=phone,
@@ -521,7 +775,6 @@ def make_permission_call():
             url=twiml_url
         )
         
-        student_name = student_row[2]
         log_call(student_name, 'permission', target, phone, call.sid)
         
         return jsonify({'success': True, 'call_sid': call.sid})
@@ -532,9 +785,12 @@ def make_permission_call():
 @app.route('/twiml/permission/<int:row_index>/<target>')
 def twiml_permission(row_index, target):
     """Generate TwiML for permission call"""
+    from twilio.twiml.voice_response import VoiceResponse, Gather
     try:
         worksheet = get_google_sheet()
         student_row = worksheet.row_values(row_index)
+        if check_student_row(student_row, request.args.get('student')):
+            raise ValueError('Student row changed since the call was placed')
         
         student_name = student_row[2]
         gender = student_row[3]
@@ -549,7 +805,7 @@ def twiml_permission(row_index, target):
         
         gather = Gather(
             num_digits=1,
-            action=f'/twiml/response/{row_index}/{target}',
+            action=f'/twiml/response/{row_index}/{target}?student={quote(student_name)}',
             method='POST'
         )
         gather.say("Anumati ivvadaniki okati nokkandi. Voddu anadaniki rendu nokkandi.", 
@@ -568,6 +824,7 @@ def twiml_permission(row_index, target):
 @app.route('/twiml/response/<int:row_index>/<target>', methods=['POST'])
 def handle_response(row_index, target):
     """Handle IVR response"""
+    from twilio.twiml.voice_response import VoiceResponse
     digit = request.form.get('Digits', '')
     
     response = VoiceResponse()
@@ -575,18 +832,18 @@ def handle_response(row_index, target):
     if digit == '1':
         response.say("Anumati ivvabadindi. Dhanyavadamulu!", voice='Polly.Aditi', language='hi-IN')
         try:
-            worksheet = get_google_sheet()
-            student_row = worksheet.row_values(row_index)
-            student_name = student_row[2]
+            student_name = request.args.get('student')
+            if student_name is None:
+                student_name = get_google_sheet().row_values(row_index)[2]
             log_permission_response(student_name, target, 'Granted')
         except:
             pass
     elif digit == '2':
         response.say("Anumati nirakarinchbadindi. Dhanyavadamulu!", voice='Polly.Aditi', language='hi-IN')
         try:
-            worksheet = get_google_sheet()
-            student_row = worksheet.row_values(row_index)
-            student_name = student_row[2]
+            student_name = request.args.get('student')
+            if student_name is None:
+                student_name = get_google_sheet().row_values(row_index)[2]
             log_permission_response(student_name, target, 'Denied')
         except:
             pass
@@ -658,6 +915,121 @@ def get_logs():
     except:
         return jsonify({'logs': []})
 
+@app.route('/reports')
+def view_reports():
+    """Reports dashboard page"""
+    return render_template_string("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Call Reports</title>
+    <style>
+        body { font-family: Arial; padding: 20px; background: #f5f5f5; }
+        .container { max-width: 1200px; margin: 0 auto; background: white; padding: 30px; border-radius: 10px; }
+        h1, h2 { color: #333; }
+        table { width: 100%; border-collapse: collapse; margin-top: 20px; }
+        th, td { padding: 10px; text-align: left; border-bottom: 1px solid #ddd; }
+        th { background: #4a5568; color: white; }
+        .back-btn { display: inline-block; padding: 10px 20px; background: #667eea; color: white; text-decoration: none; border-radius: 5px; margin-bottom: 20px; }
+        .cards { display: flex; gap: 15px; flex-wrap: wrap; }
+        .card { flex: 1; min-width: 150px; background: #edf2f7; padding: 15px; border-radius: 8px; text-align: center; }
+        .card b { display: block; font-size: 28px; color: #4a5568; }
+        .chart { display: flex; align-items: flex-end; gap: 4px; height: 200px; border-bottom: 1px solid #ddd; margin-top: 20px; }
+        .bar { flex: 1; display: flex; flex-direction: column-reverse; min-width: 8px; }
+        .bar .late { background: #f56565; }
+        .bar .permission { background: #ed8936; }
+        .legend span { display: inline-block; width: 12px; height: 12px; margin: 0 5px 0 15px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <a href="/" class="back-btn">Back to Dashboard</a>
+        <h1>Call Reports</h1>
+        <label>Month: <input type="month" id="month" onchange="loadReports()"></label>
+        <div id="reportsContent">Loading...</div>
+    </div>
+    <script>
+        function loadReports() {
+            const month = document.getElementById('month').value;
+            fetch('/api/reports' + (month ? '?month=' + month : ''))
+                .then(r => r.json())
+                .then(data => {
+                    if (data.error) {
+                        document.getElementById('reportsContent').innerHTML = '<p>Error: ' + data.error + '</p>';
+                        return;
+                    }
+                    document.getElementById('month').value = data.month;
+                    const t = data.month_totals;
+                    let html = '<div class="cards">';
+                    html += '<div class="card"><b>' + (t.calls || 0) + '</b>Calls</div>';
+                    html += '<div class="card"><b>' + (t.late || 0) + '</b>Late calls</div>';
+                    html += '<div class="card"><b>' + (t.permission || 0) + '</b>Permission calls</div>';
+                    html += '<div class="card"><b>' + (data.grant_rate === null ? '-' : Math.round(data.grant_rate * 100) + '%') + '</b>Grant rate</div>';
+                    html += '</div>';
+                    
+                    html += '<h2>Calls per day</h2>';
+                    html += '<div class="legend"><span style="background:#f56565"></span>Late<span style="background:#ed8936"></span>Permission</div>';
+                    html += '<div class="chart">';
+                    const days = Object.keys(data.by_day).sort();
+                    const peak = Math.max(1, ...days.map(d => data.by_day[d].calls || 0));
+                    days.forEach(day => {
+                        const c = data.by_day[day];
+                        html += '<div class="bar" title="' + day + ': ' + (c.calls || 0) + ' calls">';
+                        html += '<div class="late" style="height:' + ((c.late || 0) * 200 / peak) + 'px"></div>';
+                        html += '<div class="permission" style="height:' + ((c.permission || 0) * 200 / peak) + 'px"></div>';
+                        html += '</div>';
+                    });
+                    html += '</div>';
+                    
+                    html += '<h2>Per student</h2>';
+                    html += '<table><tr><th>Student</th><th>Late</th><th>Permission</th><th>Granted</th><th>Denied</th></tr>';
+                    Object.keys(data.by_student).sort().forEach(name => {
+                        const c = data.by_student[name];
+                        html += '<tr><td>' + name + '</td><td>' + (c.late || 0) + '</td><td>' + (c.permission || 0) + '</td>';
+                        html += '<td>' + (c.Granted || 0) + '</td><td>' + (c.Denied || 0) + '</td></tr>';
+                    });
+                    html += '</table>';
+                    document.getElementById('reportsContent').innerHTML = html;
+                })
+                .catch(e => {
+                    document.getElementById('reportsContent').innerHTML = '<p>Error loading reports.</p>';
+                });
+        }
+        loadReports();
+    </script>
+</body>
+</html>
+""")
+
+@app.route('/api/reports')
+def get_reports():
+    """Get call aggregates for a month (YYYY-MM, default current month)"""
+    month = request.args.get('month') or datetime.now().strftime('%Y-%m')
+    try:
+        month = datetime.strptime(month, '%Y-%m').strftime('%Y-%m')
+    except ValueError:
+        return jsonify({'error': 'month must be YYYY-MM'}), 400
+    try:
+        if not refresh_rollups():
+            return jsonify({'error': 'Cannot connect to sheets'})
+        with _rollups_lock:
+            by_day = {day: dict(counts) for day, counts in _rollups['days'].items() if day[:7] == month}
+            by_student = {name: dict(counts) for name, counts in _rollups['students'].get(month, {}).items()}
+            totals = dict(_rollups['totals'])
+        month_totals = Counter()
+        for counts in by_day.values():
+            month_totals.update(counts)
+        return jsonify({
+            'month': month,
+            'totals': totals,
+            'month_totals': dict(month_totals),
+            'grant_rate': _grant_rate(month_totals),
+            'by_day': by_day,
+            'by_student': by_student
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)})
+
 # ============= HELPER FUNCTIONS =============
 def log_call(student_name, call_type, target, phone, call_sid):
     """Log call to Google Sheets"""
@@ -665,7 +1037,12 @@ def log_call(student_name, call_type, target, phone, call_sid):
         worksheet = get_call_log_sheet()
         if worksheet:
             timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            worksheet.append_row([timestamp, student_name, call_type, target, phone, call_sid, ''])
+            result = worksheet.append_row([timestamp, student_name, call_type, target, phone, call_sid, ''])
+            sheet_row = _appended_row(result)
+            # Rows at or below the rebuild's row count are already in its snapshot
+            with _rollups_lock:
+                if _rollups is not None and sheet_row > _rollups['rows']:
+                    _rollup_call(_rollups, timestamp, student_name, call_type, target)
     except Exception as e:
         print(f"Error logging call: {e}")
 
@@ -679,6 +1056,10 @@ def log_permission_response(student_name, target, response):
                 if len(all_values[i]) > 2:
                     if all_values[i][1] == student_name and all_values[i][2] == 'permission':
                         worksheet.update_cell(i + 1, 7, response)
+                        # The previous response is looked up in the rollups under the lock
+                        with _rollups_lock:
+                            if _rollups is not None:
+                                _rollup_response(_rollups, i + 1, all_values[i][0], student_name, response)
                         break
     except Exception as e:
         print(f"Error logging response: {e}")
@@ -692,10 +1073,38 @@ def not_found(e):
 def server_error(e):
     return "Server error", 500
 
+# ============= STARTUP =============
+def _warmup_clients():
+    started = time.perf_counter()
+    get_twilio_client()
+    try:
+        get_roster()
+    except Exception as e:
+        print(f"Warmup error: {e}")
+    startup_timings['warmup_seconds'] = round(time.perf_counter() - started, 3)
+
+def warmup():
+    """Authenticate clients and prime the roster cache.
+
+    Call it in the process that serves requests (gunicorn.conf.py runs it in
+    post_worker_init), never before a fork such as gunicorn --preload. Waits
+    at most WARMUP_TIMEOUT_SECONDS; after that warmup carries on in the
+    background and /readyz stays 503 until the clients are up.
+    """
+    thread = threading.Thread(target=_warmup_clients, daemon=True)
+    thread.start()
+    thread.join(WARMUP_TIMEOUT_SECONDS)
+    if thread.is_alive():
+        print(f"Warmup still running after {WARMUP_TIMEOUT_SECONDS:.0f}s, serving anyway")
+
+startup_timings['import_seconds'] = round(time.perf_counter() - _BOOT_STARTED, 3)
+
 # ============= MAIN =============
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     print(f"Starting server on port {port}")
     print(f"Twilio: {bool(TWILIO_ACCOUNT_SID)}")
     print(f"Sheets: {bool(GOOGLE_SHEETS_CREDS)}")
+    if PRELOAD_CLIENTS:
+        warmup()
     app.run(host='0.0.0.0', port=port, debug=False)